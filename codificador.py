@@ -0,0 +1,173 @@
+from itertools import repeat
+
+import simbolos as _simbolos
+
+# numpy se importa dentro de las funciones, igual que pandas en storage.py,
+# para no sumar su tiempo de carga al importar huffman/shannon.
+
+# Cantidad de símbolos procesados por bloque: los temporales entran en caché
+TAMANO_BLOQUE = 1 << 14
+
+# Por debajo de esta cantidad de símbolos conviene el diccionario + "".join
+UMBRAL_VECTORIZADO = 2048
+
+# Longitud máxima de código que entra en el acumulador de 64 bits
+LONGITUD_MAXIMA = 64
+
+
+def _tablas_codigos(codigos: dict[str, str], posiciones: dict[str, int], tamano: int):
+    """
+    Precalcula, una sola vez por mapa de códigos, dos tablas indexadas por la posición
+    de cada símbolo (su punto de código, o su índice si los símbolos son de varios caracteres):
+      - largo: longitud en bits del código (0 si la posición no tiene código)
+      - alineado: valor del código alineado a la izquierda en una palabra de 64 bits
+    La última posición queda siempre vacía y recibe los símbolos desconocidos.
+    """
+    import numpy as np
+
+    largo = np.zeros(tamano, dtype=np.uint64)
+    alineado = np.zeros(tamano, dtype=np.uint64)
+    for simbolo, codigo in codigos.items():
+        if len(codigo) > LONGITUD_MAXIMA:
+            raise ValueError(f"codificador.py - Código de más de {LONGITUD_MAXIMA} bits: {simbolo!r}")
+        largo[posiciones[simbolo]] = len(codigo)
+        alineado[posiciones[simbolo]] = int(codigo, 2) << (LONGITUD_MAXIMA - len(codigo))
+    return largo, alineado
+
+
+def _posiciones_texto(codigos: dict[str, str], texto: str):
+    """
+    Tablas por punto de código y arreglo uint32 de puntos de código del texto.
+    Los puntos fuera de la tabla se corrigen por bloque, en `codificar_bytes`.
+    """
+    import numpy as np
+
+    tamano = max(map(ord, codigos)) + 2
+    tablas = _tablas_codigos(codigos, {s: ord(s) for s in codigos}, tamano)
+    puntos = np.frombuffer(texto.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+    return tablas, puntos
+
+
+def _posiciones_simbolos(codigos: dict[str, str], simbolos: list[str]):
+    """Tablas por índice de símbolo y arreglo de índices de una secuencia de símbolos (n-gramas, palabras)."""
+    import numpy as np
+
+    posiciones = {s: i for i, s in enumerate(codigos)}
+    tablas = _tablas_codigos(codigos, posiciones, len(posiciones) + 1)
+    indices = np.fromiter(
+        map(posiciones.get, simbolos, repeat(len(posiciones))), dtype=np.intp, count=len(simbolos)
+    )
+    return tablas, indices
+
+
+def _posiciones_secuencia(codigos: dict[str, str], secuencia: "_simbolos.SecuenciaSimbolos"):
+    """Tablas por índice del alfabeto de la secuencia; sus índices se usan tal cual."""
+    posiciones = {s: i for i, s in enumerate(secuencia.alfabeto)}
+    tablas = _tablas_codigos(
+        {s: c for s, c in codigos.items() if s in posiciones}, posiciones, len(posiciones) + 1
+    )
+    return tablas, secuencia.indices
+
+
+def _codificar_bits_join(
+    codigos: dict[str, str],
+    texto: "str | list[str] | _simbolos.SecuenciaSimbolos",
+) -> str:
+    """Codificación directa con el diccionario, más rápida para entradas cortas."""
+    try:
+        return "".join([codigos[s] for s in texto])
+    except KeyError as e:
+        raise ValueError(f"codificador.py - Símbolo sin código: {e.args[0]!r}") from None
+
+
+def codificar_bytes(
+    codigos: dict[str, str],
+    texto: "str | list[str] | _simbolos.SecuenciaSimbolos",
+) -> tuple[bytes, int]:
+    """
+    Codifica el texto (o la secuencia de símbolos) y lo empaqueta en bytes
+    (MSB primero, el último byte se completa con ceros).
+
+    En lugar de buscar el código de cada carácter en un diccionario, el texto se convierte
+    una vez en un arreglo de posiciones de símbolo y cada código (valor, largo) se acumula
+    con operaciones vectorizadas en palabras de 64 bits. Un código que no entra en la
+    palabra actual se reparte entre ella y la siguiente.
+
+    El costo lo dominan las ~12 pasadas vectorizadas sobre los datos, no la cantidad de
+    bloques: todo el trabajo se hace por bloques chicos para que los temporales queden
+    en caché, y las entradas cortas usan directamente el diccionario.
+
+    Returns:
+        tuple: (bytes empaquetados, cantidad de bits válidos).
+    """
+    import numpy as np
+
+    if len(texto) < UMBRAL_VECTORIZADO:
+        bits = _codificar_bits_join(codigos, texto)
+        if not bits:
+            return b"", 0
+        relleno = -len(bits) % 8
+        return (int(bits, 2) << relleno).to_bytes((len(bits) + relleno) // 8, "big"), len(bits)
+
+    es_texto = isinstance(texto, str)
+    if es_texto:
+        (tabla_largo, tabla_alineado), puntos = _posiciones_texto(codigos, texto)
+    elif isinstance(texto, _simbolos.SecuenciaSimbolos):
+        (tabla_largo, tabla_alineado), puntos = _posiciones_secuencia(codigos, texto)
+    else:
+        (tabla_largo, tabla_alineado), puntos = _posiciones_simbolos(codigos, texto)
+    tamano = len(tabla_largo)
+
+    # Cada código ocupa a lo sumo 64 bits: como máximo una palabra por símbolo
+    palabras = np.zeros(len(puntos) + 2, dtype=np.uint64)
+    total_bits = 0
+
+    for desde in range(0, len(puntos), TAMANO_BLOQUE):
+        bloque = puntos[desde:desde + TAMANO_BLOQUE].astype(np.intp)
+        if es_texto and bloque.max() >= tamano:
+            bloque[bloque >= tamano] = tamano - 1
+
+        largos = np.take(tabla_largo, bloque)
+        if not largos.all():
+            faltante = desde + int(np.argmin(largos))
+            raise ValueError(f"codificador.py - Símbolo sin código: {texto[faltante]!r}")
+
+        fin = np.cumsum(largos)
+        fin += np.uint64(total_bits)
+        posicion = fin - largos
+        alineados = np.take(tabla_alineado, bloque)
+        palabra = posicion >> np.uint64(6)
+        desplazamiento = posicion & np.uint64(63)
+
+        # Las posiciones son crecientes: los códigos de una misma palabra son contiguos
+        # y, al no superponerse sus bits, se combinan con un OR por grupo. Todas las
+        # palabras del bloque reciben el inicio de algún código (ninguno supera 64 bits),
+        # por lo que el destino es un rango continuo
+        inicios = np.concatenate(([0], np.flatnonzero(palabra[1:] != palabra[:-1]) + 1))
+        primera, ultima = int(palabra[0]), int(palabra[-1]) + 1
+        palabras[primera:ultima] |= np.bitwise_or.reduceat(alineados >> desplazamiento, inicios)
+        # Bits que desbordan la palabra (un corrimiento de 64 da 0 en numpy)
+        palabras[primera + 1:ultima + 1] |= np.bitwise_or.reduceat(
+            alineados << (np.uint64(64) - desplazamiento), inicios
+        )
+        total_bits = int(fin[-1])
+
+    return palabras[:(total_bits + 63) // 64].astype(">u8").tobytes()[:(total_bits + 7) // 8], total_bits
+
+
+def desempaquetar_bits(datos: bytes, total_bits: int) -> str:
+    """Operación inversa de `codificar_bytes`: devuelve la cadena de bits ('0'/'1')."""
+    import numpy as np
+
+    bits = np.unpackbits(np.frombuffer(datos, dtype=np.uint8), count=total_bits)
+    return (bits + ord("0")).tobytes().decode("ascii")
+
+
+def codificar_bits(
+    codigos: dict[str, str],
+    texto: "str | list[str] | _simbolos.SecuenciaSimbolos",
+) -> str:
+    """Codifica el texto (o la secuencia de símbolos) como cadena de bits ('0'/'1')."""
+    if len(texto) < UMBRAL_VECTORIZADO:
+        return _codificar_bits_join(codigos, texto)
+    return desempaquetar_bits(*codificar_bytes(codigos, texto))
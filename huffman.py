@@ -2,6 +2,8 @@ import heapq
 import time
 from typing import Any
 
+import codificador
+
 class NodoHuffman:
     """
     Representa un nodo del árbol de Huffman.
@@ -126,24 +128,45 @@ def decodificar_huffman(datos: dict[str, Any], texto_codificado: str) -> str:
     return "".join(resultado)
 
 
-def generar_texto_codificado(datos: dict[str, Any], texto_original: str) -> str:
+def generar_texto_codificado(datos: dict[str, Any], texto_original: str | list[str]) -> str:
     """
     Genera el texto binario codificado a partir del texto original
     utilizando los códigos Huffman previamente generados.
 
     Args:
         datos (dict): Debe incluir 'Codigos'.
-        texto_original (str): Texto original a codificar.
+        texto_original (str | list[str]): Texto original o secuencia de símbolos (ver simbolos.tokenizar).
 
     Returns:
         str: Texto binario codificado.
     """
     inicio = time.perf_counter()
 
-    codigos = datos["Codigos"]
-    texto_codificado = "".join(codigos[s] for s in texto_original)
+    texto_codificado = codificador.codificar_bits(datos["Codigos"], texto_original)
 
     fin = time.perf_counter()
     datos["TiempoGeneracion"] = round(fin - inicio, 6)
 
     return texto_codificado
+
+
+def generar_bytes_codificados(datos: dict[str, Any], texto_original: str | list[str]) -> tuple[bytes, int]:
+    """
+    Genera el texto codificado empaquetado en bytes (8 bits por byte)
+    utilizando los códigos Huffman previamente generados.
+
+    Args:
+        datos (dict): Debe incluir 'Codigos'.
+        texto_original (str | list[str]): Texto original o secuencia de símbolos (ver simbolos.tokenizar).
+
+    Returns:
+        tuple: (bytes empaquetados, cantidad de bits válidos).
+    """
+    inicio = time.perf_counter()
+
+    resultado = codificador.codificar_bytes(datos["Codigos"], texto_original)
+
+    fin = time.perf_counter()
+    datos["TiempoGeneracion"] = round(fin - inicio, 6)
+
+    return resultado
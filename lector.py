@@ -1,16 +1,19 @@
 import os
-from docx import Document
-from PyPDF2 import PdfReader
+
+# python-docx y PyPDF2 se importan dentro de cada lector: solo se cargan
+# cuando se procesa un archivo de ese formato.
 
 
 def leer_docx(ruta: str) -> str:
     """Lee y devuelve el texto de un archivo .docx."""
+    from docx import Document
     doc = Document(ruta)
     return "\n".join(p.text for p in doc.paragraphs if p.text.strip())
 
 
 def leer_pdf(ruta: str) -> str:
     """Lee y devuelve el texto de un archivo .pdf."""
+    from PyPDF2 import PdfReader
     reader = PdfReader(ruta)
     textos = [page.extract_text() for page in reader.pages if page.extract_text()]
     return "\n".join(textos)
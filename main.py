@@ -1,97 +1,92 @@
 import argparse
-import os
-import lector
-import simbolos
-import storage
+import pipeline
 import shannon
-import huffman
-import lempel
-import promedios
-
-# --- Configuración de directorios ---
-DIRECTORIOS_SALIDA = ["./planillas", "./codificado", "./decodificado"]
-for d in DIRECTORIOS_SALIDA:
-    os.makedirs(d, exist_ok=True)
-
-# --- Argumentos ---
-parser = argparse.ArgumentParser(description="Procesa un directorio de archivos de texto")
-parser.add_argument("directorio", help="Directorio a procesar")
-args = parser.parse_args()
-
-
-def guardar_archivos_codificados(nombre_base, codificado, decodificado, sufijo):
-    """Guarda archivos codificados y decodificados en las carpetas correspondientes"""
-    path_codificado = f"./codificado/{nombre_base}_{sufijo}.txt"
-    path_decodificado = f"./decodificado/{nombre_base}_{sufijo}.txt"
-
-    with open(path_codificado, "w", encoding="utf-8") as f:
-        f.write(codificado)
-    with open(path_decodificado, "w", encoding="utf-8") as f:
-        f.write(decodificado)
-
-
-def procesar_archivo(ruta_archivo):
-    """Procesa un archivo: símbolos, codificación Shannon, Huffman y Lempel-Ziv"""
-    contenido = lector.leer_archivo(ruta_archivo)
-    nombre_base = os.path.splitext(os.path.basename(ruta_archivo))[0]
-
-    # --- Información de símbolos ---
-    ruta_simbolos = f"./planillas/{nombre_base}_simbolo.xlsx"
-    info_simbolos = simbolos.calcular_informacion_simbolos(contenido)
-    storage.persistir_simbolos(info_simbolos, ruta_simbolos)
-
-    # --- Codificación ---
-    shan = shannon.codificar_shannon_fano(storage.recuperar_simbolos(ruta_simbolos))
-    huff = huffman.codificar_huffman(storage.recuperar_simbolos(ruta_simbolos))
-    lemp = lempel.lz77_compress_con_metrica(contenido)
-
-    # --- Guardar codificado y decodificado ---
-    guardar_archivos_codificados(
-        nombre_base,
-        shannon.generar_texto_codificado(shan, contenido),
-        shannon.decodificar_shannon_fano(shan, shannon.generar_texto_codificado(shan, contenido)),
-        "shannon"
-    )
-
-    guardar_archivos_codificados(
-        nombre_base,
-        huffman.generar_texto_codificado(huff, contenido),
-        huffman.decodificar_huffman(huff, huffman.generar_texto_codificado(huff, contenido)),
-        "huffman"
-    )
-
-    guardar_archivos_codificados(
-        nombre_base,
-        str(lemp["Comprimido"]),
-        lempel.lz77_decompress(lemp["Comprimido"]),
-        "lempel-ziv"
-    )
-
-    # --- Guardar Excel ---
-    storage.persistir_shannon_fano(shan, f"./planillas/{nombre_base}_shannon.xlsx")
-    storage.persistir_huffman(huff, f"./planillas/{nombre_base}_huffman.xlsx")
-    storage.persistir_lz77(lemp, f"./planillas/{nombre_base}_lempel-ziv.xlsx")
+import simbolos
 
-    return info_simbolos
 
+def parsear_argumentos(argv=None):
+    """Define y parsea los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Procesa un directorio de archivos de texto")
+    parser.add_argument("directorio", nargs="?", help="Directorio a procesar")
+    parser.add_argument("--salida", default=".",
+                        help="Carpeta base de planillas/, codificado/ y decodificado/")
+    parser.add_argument("--paralelo", action="store_true",
+                        help="Solapa lectura, codificación y escritura en un pipeline asíncrono")
+    parser.add_argument("--lectores", type=int, default=2, help="Hilos lectores del pipeline")
+    parser.add_argument("--codificadores", type=int, default=None,
+                        help="Procesos codificadores del pipeline (por defecto, núcleos disponibles)")
+    parser.add_argument("--tamano-cola", type=int, default=4, help="Capacidad de las colas entre etapas")
+    parser.add_argument("--alfabeto", choices=simbolos.ALFABETOS, default="caracter",
+                        help="Símbolos para Shannon-Fano y Huffman: caracteres, n-gramas o palabras")
+    parser.add_argument("-n", type=int, default=2, help="Tamaño de los n-gramas con --alfabeto ngrama")
+    parser.add_argument("--estrategia-shannon", choices=shannon.ESTRATEGIAS, default="fano",
+                        help="Regla de división de Shannon-Fano")
+    parser.add_argument("--servidor", action="store_true",
+                        help="Modo demonio: recibe rutas de archivos por stdin (o por --puerto)")
+    parser.add_argument("--puerto", type=int, default=None,
+                        help="Puerto local (127.0.0.1) en el que escucha el modo demonio")
+
+    args = parser.parse_args(argv)
+    if not args.servidor and args.directorio is None:
+        parser.error("se requiere 'directorio' salvo en modo --servidor")
+    if args.servidor and args.directorio is not None:
+        parser.error("'directorio' no se usa en modo --servidor: las rutas se reciben por stdin o --puerto")
+    for opcion, valor in (("--lectores", args.lectores), ("--codificadores", args.codificadores),
+                          ("--tamano-cola", args.tamano_cola)):
+        if valor is not None and valor < 1:
+            parser.error(f"{opcion} debe ser mayor o igual a 1")
+    if args.n < 1:
+        parser.error("-n debe ser mayor o igual a 1")
+    return args
+
+
+def imprimir_metricas(metricas):
+    """Muestra la utilización y la profundidad de colas de cada etapa del pipeline"""
+    print(f"Tiempo total: {metricas['TiempoTotal']} s")
+    for etapa in metricas["Etapas"]:
+        print(
+            f"  {etapa['Etapa']}: {etapa['Procesados']} archivos, "
+            f"{etapa['Trabajadores']} trabajadores, "
+            f"utilización {etapa['Utilizacion']:.0%}, "
+            f"cola máx {etapa['ProfundidadMaximaCola']} / prom {etapa['ProfundidadPromedioCola']}"
+        )
+
+
+def main(argv=None):
+    args = parsear_argumentos(argv)
+
+    if args.servidor:
+        import servidor
+        servidor.ejecutar(
+            puerto=args.puerto,
+            directorio_salida=args.salida,
+            lectores=args.lectores,
+            codificadores=args.codificadores,
+            alfabeto=args.alfabeto,
+            n=args.n,
+            estrategia=args.estrategia_shannon,
+        )
+        return
 
-def main():
-    if not os.path.isdir(args.directorio):
+    opciones = {}
+    if args.paralelo:
+        opciones = {
+            "lectores": args.lectores,
+            "codificadores": args.codificadores,
+            "tamano_cola": args.tamano_cola,
+        }
+
+    try:
+        resultado = pipeline.procesar_directorio(
+            args.directorio, directorio_salida=args.salida, paralelo=args.paralelo,
+            alfabeto=args.alfabeto, n=args.n, estrategia=args.estrategia_shannon, **opciones
+        )
+    except NotADirectoryError:
         print(f"main.py - Error: '{args.directorio}' no es un directorio válido")
         return
 
-    # --- Lista de archivos a procesar ---
-    archivos = [
-        os.path.join(args.directorio, f)
-        for f in os.listdir(args.directorio)
-        if os.path.isfile(os.path.join(args.directorio, f))
-    ]
-
-    resultados_simbolos = [procesar_archivo(a) for a in archivos]
-
-    # --- Calcular y persistir promedios ---
-    promedios_generales = promedios.calcular_promedios(resultados_simbolos)
-    storage.persistir_promedios(promedios_generales, "./planillas/promedio_simbolos.xlsx")
+    if resultado["Metricas"]:
+        imprimir_metricas(resultado["Metricas"])
 
 
 if __name__ == "__main__":
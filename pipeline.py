@@ -0,0 +1,389 @@
+import asyncio
+import copy
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+import codificador
+import lector
+import simbolos
+import storage
+import shannon
+import huffman
+import lempel
+import promedios
+
+DIRECTORIOS_SALIDA = ["planillas", "codificado", "decodificado"]
+
+# ========================
+# Etapas del procesamiento
+# ========================
+
+def codificar_contenido(
+    nombre_base: str,
+    contenido: str,
+    alfabeto: str = "caracter",
+    n: int = 2,
+    estrategia: str = "fano",
+) -> dict[str, Any]:
+    """
+    Etapa de CPU: calcula los símbolos y codifica el contenido con Shannon-Fano,
+    Huffman y Lempel-Ziv. No realiza I/O, por lo que puede ejecutarse en otro proceso.
+
+    Args:
+        nombre_base (str): Nombre del archivo sin extensión.
+        contenido (str): Texto a codificar.
+        alfabeto (str): Alfabeto de Shannon-Fano y Huffman ('caracter', 'ngrama' o 'palabra').
+        n (int): Tamaño de los n-gramas si alfabeto es 'ngrama'.
+        estrategia (str): Regla de división de Shannon-Fano ('fano' o 'balanceada').
+
+    Returns:
+        dict: Resultados listos para ser persistidos por `escribir_resultados`.
+    """
+    secuencia = simbolos.tokenizar(contenido, alfabeto, n)
+    info_simbolos = simbolos.calcular_informacion_simbolos(secuencia)
+
+    # Cada codificador trabaja sobre su propia copia porque agrega columnas a los símbolos
+    shan = shannon.codificar_shannon_fano(copy.deepcopy(info_simbolos), estrategia)
+    huff = huffman.codificar_huffman(copy.deepcopy(info_simbolos))
+    lemp = lempel.lz77_compress_con_metrica(contenido)
+
+    # Se generan los bits empaquetados (el archivo .bin) y de ellos la cadena '0'/'1'
+    # que usan los decodificadores y el archivo .txt
+    shan_bytes, shan_bits = shannon.generar_bytes_codificados(shan, secuencia)
+    huff_bytes, huff_bits = huffman.generar_bytes_codificados(huff, secuencia)
+    shan_codificado = codificador.desempaquetar_bits(shan_bytes, shan_bits)
+    huff_codificado = codificador.desempaquetar_bits(huff_bytes, huff_bits)
+
+    return {
+        "NombreBase": nombre_base,
+        "Simbolos": info_simbolos,
+        "Shannon": shan,
+        "Huffman": huff,
+        "Lempel": lemp,
+        "Binarios": {"shannon": shan_bytes, "huffman": huff_bytes},
+        "Archivos": {
+            "shannon": (shan_codificado, shannon.decodificar_shannon_fano(shan, shan_codificado)),
+            "huffman": (huff_codificado, huffman.decodificar_huffman(huff, huff_codificado)),
+            "lempel-ziv": (str(lemp["Comprimido"]), lempel.lz77_decompress(lemp["Comprimido"])),
+        },
+    }
+
+
+def preparar_directorios(directorio_salida: str = ".") -> None:
+    """Crea las carpetas de salida si no existen."""
+    for d in DIRECTORIOS_SALIDA:
+        os.makedirs(os.path.join(directorio_salida, d), exist_ok=True)
+
+
+def guardar_archivos_codificados(nombre_base, codificado, decodificado, sufijo, directorio_salida="."):
+    """Guarda archivos codificados y decodificados en las carpetas correspondientes"""
+    path_codificado = os.path.join(directorio_salida, "codificado", f"{nombre_base}_{sufijo}.txt")
+    path_decodificado = os.path.join(directorio_salida, "decodificado", f"{nombre_base}_{sufijo}.txt")
+
+    with open(path_codificado, "w", encoding="utf-8") as f:
+        f.write(codificado)
+    with open(path_decodificado, "w", encoding="utf-8") as f:
+        f.write(decodificado)
+
+
+def escribir_resultados(resultado: dict[str, Any], directorio_salida: str = ".") -> None:
+    """Etapa de I/O: persiste los textos codificados/decodificados y las planillas Excel."""
+    nombre_base = resultado["NombreBase"]
+    planillas = os.path.join(directorio_salida, "planillas")
+
+    for sufijo, (codificado, decodificado) in resultado["Archivos"].items():
+        guardar_archivos_codificados(nombre_base, codificado, decodificado, sufijo, directorio_salida)
+
+    for sufijo, binario in resultado["Binarios"].items():
+        ruta_binaria = os.path.join(directorio_salida, "codificado", f"{nombre_base}_{sufijo}.bin")
+        with open(ruta_binaria, "wb") as f:
+            f.write(binario)
+
+    storage.persistir_simbolos(resultado["Simbolos"], os.path.join(planillas, f"{nombre_base}_simbolo.xlsx"))
+    storage.persistir_shannon_fano(resultado["Shannon"], os.path.join(planillas, f"{nombre_base}_shannon.xlsx"))
+    storage.persistir_huffman(resultado["Huffman"], os.path.join(planillas, f"{nombre_base}_huffman.xlsx"))
+    storage.persistir_lz77(resultado["Lempel"], os.path.join(planillas, f"{nombre_base}_lempel-ziv.xlsx"))
+
+
+def procesar_archivo(
+    ruta_archivo: str,
+    directorio_salida: str = ".",
+    alfabeto: str = "caracter",
+    n: int = 2,
+    estrategia: str = "fano",
+) -> dict[str, Any]:
+    """
+    Procesa un archivo de forma secuencial: lectura, codificación y escritura.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo .docx o .pdf.
+        directorio_salida (str): Carpeta base donde se crean planillas/, codificado/ y decodificado/.
+        alfabeto (str): Alfabeto de símbolos, ver `simbolos.tokenizar`.
+        n (int): Tamaño de los n-gramas si alfabeto es 'ngrama'.
+        estrategia (str): Regla de división de Shannon-Fano ('fano' o 'balanceada').
+
+    Returns:
+        dict: Información de símbolos del archivo.
+    """
+    preparar_directorios(directorio_salida)
+    contenido = lector.leer_archivo(ruta_archivo)
+    nombre_base = os.path.splitext(os.path.basename(ruta_archivo))[0]
+
+    resultado = codificar_contenido(nombre_base, contenido, alfabeto, n, estrategia)
+    escribir_resultados(resultado, directorio_salida)
+    return resultado["Simbolos"]
+
+# ========================
+# Métricas del pipeline
+# ========================
+
+class MetricasEtapa:
+    """
+    Acumula el tiempo ocupado de los trabajadores de una etapa y la profundidad
+    de la cola que la alimenta, para poder dimensionar los pools.
+    """
+    def __init__(self, nombre: str, trabajadores: int):
+        self.nombre = nombre
+        self.trabajadores = trabajadores
+        self.tiempo_ocupado = 0.0
+        self.procesados = 0
+        self.profundidad_maxima = 0
+        self.suma_profundidad = 0
+        self.muestras = 0
+
+    def registrar_cola(self, profundidad: int) -> None:
+        """Registra la profundidad actual de la cola de entrada de la etapa."""
+        self.profundidad_maxima = max(self.profundidad_maxima, profundidad)
+        self.suma_profundidad += profundidad
+        self.muestras += 1
+
+    def registrar_trabajo(self, duracion: float) -> None:
+        self.tiempo_ocupado += duracion
+        self.procesados += 1
+
+    def resumen(self, tiempo_total: float) -> dict[str, Any]:
+        capacidad = tiempo_total * self.trabajadores
+        return {
+            "Etapa": self.nombre,
+            "Trabajadores": self.trabajadores,
+            "Procesados": self.procesados,
+            "TiempoOcupado": round(self.tiempo_ocupado, 6),
+            "Utilizacion": round(self.tiempo_ocupado / capacidad, 4) if capacidad > 0 else 0,
+            "ProfundidadMaximaCola": self.profundidad_maxima,
+            "ProfundidadPromedioCola": (
+                round(self.suma_profundidad / self.muestras, 4) if self.muestras else 0
+            ),
+        }
+
+# ========================
+# Pipeline asíncrono
+# ========================
+
+async def _lector(rutas, cola_salida, pool, metricas):
+    loop = asyncio.get_running_loop()
+    while rutas:
+        metricas.registrar_cola(len(rutas))
+        indice, ruta = rutas.pop()
+        inicio = time.perf_counter()
+        contenido = await loop.run_in_executor(pool, lector.leer_archivo, ruta)
+        metricas.registrar_trabajo(time.perf_counter() - inicio)
+
+        nombre_base = os.path.splitext(os.path.basename(ruta))[0]
+        # Si la cola está llena, el lector espera (backpressure)
+        await cola_salida.put((indice, nombre_base, contenido))
+
+
+async def _codificador(cola_entrada, cola_salida, pool, metricas, alfabeto, n, estrategia):
+    loop = asyncio.get_running_loop()
+    while True:
+        metricas.registrar_cola(cola_entrada.qsize())
+        item = await cola_entrada.get()
+        if item is None:
+            return
+        indice, nombre_base, contenido = item
+        inicio = time.perf_counter()
+        resultado = await loop.run_in_executor(
+            pool, codificar_contenido, nombre_base, contenido, alfabeto, n, estrategia
+        )
+        metricas.registrar_trabajo(time.perf_counter() - inicio)
+        await cola_salida.put((indice, resultado))
+
+
+async def _escritor(cola_entrada, pool, metricas, resultados_simbolos, directorio_salida):
+    loop = asyncio.get_running_loop()
+    while True:
+        metricas.registrar_cola(cola_entrada.qsize())
+        item = await cola_entrada.get()
+        if item is None:
+            return
+        indice, resultado = item
+        inicio = time.perf_counter()
+        await loop.run_in_executor(pool, escribir_resultados, resultado, directorio_salida)
+        metricas.registrar_trabajo(time.perf_counter() - inicio)
+        resultados_simbolos[indice] = resultado["Simbolos"]
+
+
+async def procesar_archivos_async(
+    archivos: list[str],
+    lectores: int = 2,
+    codificadores: int | None = None,
+    tamano_cola: int = 4,
+    directorio_salida: str = ".",
+    alfabeto: str = "caracter",
+    n: int = 2,
+    estrategia: str = "fano",
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """
+    Procesa los archivos en un pipeline de tres etapas conectadas por colas acotadas:
+    lectura en un pool de hilos, codificación en un pool de procesos y escritura en
+    una única tarea dedicada. Las colas acotadas aplican backpressure, de modo que
+    disco y CPU trabajan en simultáneo sin acumular contenido en memoria.
+
+    Args:
+        archivos (list): Rutas de los archivos a procesar.
+        lectores (int): Cantidad de hilos lectores.
+        codificadores (int | None): Cantidad de procesos codificadores (None = núcleos disponibles).
+        tamano_cola (int): Capacidad máxima de cada cola entre etapas.
+        directorio_salida (str): Carpeta base de los resultados.
+        alfabeto (str): Alfabeto de símbolos, ver `simbolos.tokenizar`.
+        n (int): Tamaño de los n-gramas si alfabeto es 'ngrama'.
+        estrategia (str): Regla de división de Shannon-Fano ('fano' o 'balanceada').
+
+    Returns:
+        tuple: (información de símbolos por archivo en el orden de entrada,
+                métricas de utilización y profundidad de colas por etapa).
+    """
+    # Una cola con maxsize <= 0 no tiene límite y anularía el backpressure
+    if tamano_cola < 1:
+        raise ValueError(f"pipeline.py - Tamaño de cola inválido: {tamano_cola}")
+    codificadores = codificadores or os.cpu_count() or 1
+    lectores = max(1, min(lectores, len(archivos)))
+
+    preparar_directorios(directorio_salida)
+    rutas = list(enumerate(archivos))
+    rutas.reverse()
+    cola_contenido: asyncio.Queue = asyncio.Queue(maxsize=tamano_cola)
+    cola_resultados: asyncio.Queue = asyncio.Queue(maxsize=tamano_cola)
+    resultados_simbolos: list[Any] = [None] * len(archivos)
+
+    metricas = {
+        "Lectura": MetricasEtapa("Lectura", lectores),
+        "Codificacion": MetricasEtapa("Codificacion", codificadores),
+        "Escritura": MetricasEtapa("Escritura", 1),
+    }
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=lectores) as pool_lectura, \
+            ProcessPoolExecutor(max_workers=codificadores) as pool_codificacion, \
+            ThreadPoolExecutor(max_workers=1) as pool_escritura:
+        tareas_lectura = [
+            asyncio.create_task(_lector(rutas, cola_contenido, pool_lectura, metricas["Lectura"]))
+            for _ in range(lectores)
+        ]
+        tareas_codificacion = [
+            asyncio.create_task(_codificador(cola_contenido, cola_resultados, pool_codificacion,
+                                             metricas["Codificacion"], alfabeto, n, estrategia))
+            for _ in range(codificadores)
+        ]
+        tarea_escritura = asyncio.create_task(
+            _escritor(cola_resultados, pool_escritura, metricas["Escritura"],
+                      resultados_simbolos, directorio_salida)
+        )
+
+        async def cerrar_etapas():
+            await asyncio.gather(*tareas_lectura)
+            for _ in tareas_codificacion:
+                await cola_contenido.put(None)
+            await asyncio.gather(*tareas_codificacion)
+            await cola_resultados.put(None)
+
+        # Se esperan todas las tareas a la vez: si cualquier etapa falla, las demás
+        # quedarían bloqueadas en colas llenas o vacías, así que se cancelan y se propaga el error
+        todas = [*tareas_lectura, *tareas_codificacion, tarea_escritura,
+                 asyncio.create_task(cerrar_etapas())]
+        try:
+            hechas, _ = await asyncio.wait(todas, return_when=asyncio.FIRST_EXCEPTION)
+            error = next((t.exception() for t in hechas if t.exception() is not None), None)
+            if error is not None:
+                raise error
+        except BaseException:
+            pool_codificacion.shutdown(wait=False, cancel_futures=True)
+            for tarea in todas:
+                tarea.cancel()
+            await asyncio.gather(*todas, return_exceptions=True)
+            raise
+    tiempo_total = time.perf_counter() - inicio
+
+    resumen = {
+        "TiempoTotal": round(tiempo_total, 6),
+        "Etapas": [m.resumen(tiempo_total) for m in metricas.values()],
+    }
+    return resultados_simbolos, resumen
+
+
+def procesar_archivos(archivos: list[str], **opciones) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Punto de entrada sincrónico para `procesar_archivos_async`."""
+    return asyncio.run(procesar_archivos_async(archivos, **opciones))
+
+
+def listar_archivos(directorio: str) -> list[str]:
+    """Devuelve las rutas de los archivos (no subdirectorios) de un directorio."""
+    return [
+        os.path.join(directorio, f)
+        for f in os.listdir(directorio)
+        if os.path.isfile(os.path.join(directorio, f))
+    ]
+
+
+def procesar_directorio(
+    directorio: str,
+    directorio_salida: str = ".",
+    paralelo: bool = False,
+    alfabeto: str = "caracter",
+    n: int = 2,
+    estrategia: str = "fano",
+    **opciones,
+) -> dict[str, Any]:
+    """
+    Procesa todos los archivos de un directorio y persiste los promedios de símbolos.
+
+    Args:
+        directorio (str): Directorio con los archivos a procesar.
+        directorio_salida (str): Carpeta base de los resultados.
+        paralelo (bool): Si es True usa el pipeline asíncrono (`procesar_archivos`).
+        alfabeto (str): Alfabeto de símbolos, ver `simbolos.tokenizar`.
+        n (int): Tamaño de los n-gramas si alfabeto es 'ngrama'.
+        estrategia (str): Regla de división de Shannon-Fano ('fano' o 'balanceada').
+        **opciones: Parámetros del pipeline (lectores, codificadores, tamano_cola).
+
+    Returns:
+        dict: Promedios calculados y, en modo paralelo, las métricas del pipeline.
+
+    Lanza:
+        NotADirectoryError: Si `directorio` no es un directorio válido.
+    """
+    if not os.path.isdir(directorio):
+        raise NotADirectoryError(f"pipeline.py - '{directorio}' no es un directorio válido")
+
+    archivos = listar_archivos(directorio)
+    preparar_directorios(directorio_salida)
+
+    metricas = None
+    if paralelo:
+        resultados_simbolos, metricas = procesar_archivos(
+            archivos, directorio_salida=directorio_salida, alfabeto=alfabeto, n=n,
+            estrategia=estrategia, **opciones
+        )
+    else:
+        resultados_simbolos = [
+            procesar_archivo(a, directorio_salida, alfabeto, n, estrategia) for a in archivos
+        ]
+
+    promedios_generales = promedios.calcular_promedios(resultados_simbolos)
+    storage.persistir_promedios(
+        promedios_generales, os.path.join(directorio_salida, "planillas", "promedio_simbolos.xlsx")
+    )
+
+    return {"Promedios": promedios_generales, "Metricas": metricas}
@@ -6,6 +6,7 @@ def calcular_promedios(resultados):
         resultados (list[dict]): Lista de diccionarios, cada uno con claves como:
             - TotalSimbolos
             - EntropiaTotal
+            - EntropiaCondicional
             - ProbabilidadTotal
             - ListaSimbolos (lista de dict con métricas por símbolo)
 
@@ -27,6 +28,7 @@ def calcular_promedios(resultados):
     promedios_generales = {
         "PromedioTotalSimbolos": promedio_clave("TotalSimbolos"),
         "PromedioEntropiaTotal": promedio_clave("EntropiaTotal"),
+        "PromedioEntropiaCondicional": promedio_clave("EntropiaCondicional"),
         "PromedioProbabilidadTotal": promedio_clave("ProbabilidadTotal"),
     }
 
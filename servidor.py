@@ -0,0 +1,146 @@
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+import lector
+import pipeline
+
+
+class Servidor:
+    """
+    Modo demonio: recibe rutas de archivos (una por línea) por stdin o por un socket
+    local y las procesa reutilizando pools de hilos y procesos ya iniciados, de modo
+    que cada archivo no paga el arranque del intérprete ni la importación de dependencias.
+
+    Por cada ruta responde una línea JSON con 'Ruta', 'TotalSimbolos', 'EntropiaTotal'
+    y 'EntropiaCondicional', o 'Error' si el archivo no pudo procesarse.
+    """
+    def __init__(
+        self,
+        directorio_salida: str = ".",
+        lectores: int = 2,
+        codificadores: int | None = None,
+        alfabeto: str = "caracter",
+        n: int = 2,
+        estrategia: str = "fano",
+    ):
+        self.directorio_salida = directorio_salida
+        self.alfabeto = alfabeto
+        self.n = n
+        self.estrategia = estrategia
+        self.codificadores = codificadores or os.cpu_count() or 1
+        self.pool_lectura = ThreadPoolExecutor(max_workers=lectores)
+        self.pool_codificacion = ProcessPoolExecutor(max_workers=self.codificadores)
+        self.pool_escritura = ThreadPoolExecutor(max_workers=1)
+        pipeline.preparar_directorios(directorio_salida)
+
+    def cerrar(self) -> None:
+        self.pool_lectura.shutdown()
+        self.pool_codificacion.shutdown()
+        self.pool_escritura.shutdown()
+
+    async def procesar(self, ruta: str) -> dict[str, Any]:
+        """Procesa un archivo en los pools del servidor y devuelve su información de símbolos."""
+        loop = asyncio.get_running_loop()
+        nombre_base = os.path.splitext(os.path.basename(ruta))[0]
+
+        contenido = await loop.run_in_executor(self.pool_lectura, lector.leer_archivo, ruta)
+        resultado = await self._codificar(nombre_base, contenido)
+        await loop.run_in_executor(
+            self.pool_escritura, pipeline.escribir_resultados, resultado, self.directorio_salida
+        )
+        return resultado["Simbolos"]
+
+    async def _codificar(self, nombre_base: str, contenido: str) -> dict[str, Any]:
+        """
+        Codifica en el pool de procesos. Si un proceso murió (por ejemplo, por falta de
+        memoria) el pool queda inutilizable: se reemplaza por uno nuevo y se reintenta una vez.
+        """
+        loop = asyncio.get_running_loop()
+        argumentos = (pipeline.codificar_contenido, nombre_base, contenido,
+                      self.alfabeto, self.n, self.estrategia)
+
+        pool = self.pool_codificacion
+        try:
+            return await loop.run_in_executor(pool, *argumentos)
+        except BrokenProcessPool:
+            # Otra solicitud concurrente puede haberlo reemplazado ya
+            if self.pool_codificacion is pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+                self.pool_codificacion = ProcessPoolExecutor(max_workers=self.codificadores)
+            return await loop.run_in_executor(self.pool_codificacion, *argumentos)
+
+    async def _responder(self, ruta: str) -> str:
+        try:
+            info = await self.procesar(ruta)
+        except Exception as e:
+            return json.dumps({"Ruta": ruta, "Error": str(e)}, ensure_ascii=False)
+        return json.dumps({
+            "Ruta": ruta,
+            "TotalSimbolos": info["TotalSimbolos"],
+            "EntropiaTotal": info["EntropiaTotal"],
+            "EntropiaCondicional": info["EntropiaCondicional"],
+        }, ensure_ascii=False)
+
+    async def atender_stdin(self) -> None:
+        """Lee rutas de stdin hasta EOF y escribe una respuesta por línea en stdout."""
+        loop = asyncio.get_running_loop()
+        limite = asyncio.Semaphore(self.codificadores)
+        pendientes = set()
+
+        async def atender(ruta):
+            async with limite:
+                print(await self._responder(ruta), flush=True)
+
+        while True:
+            linea = await loop.run_in_executor(None, sys.stdin.readline)
+            if not linea:
+                break
+            ruta = linea.strip()
+            if ruta:
+                tarea = asyncio.create_task(atender(ruta))
+                pendientes.add(tarea)
+                tarea.add_done_callback(pendientes.discard)
+
+        await asyncio.gather(*pendientes)
+
+    async def _atender_conexion(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while linea := await reader.readline():
+                ruta = linea.decode("utf-8").strip()
+                if ruta:
+                    writer.write((await self._responder(ruta) + "\n").encode("utf-8"))
+                    await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def atender_socket(self, puerto: int, host: str = "127.0.0.1") -> None:
+        """Escucha conexiones TCP locales; cada conexión envía rutas, una por línea."""
+        servidor = await asyncio.start_server(self._atender_conexion, host, puerto)
+        async with servidor:
+            await servidor.serve_forever()
+
+
+def ejecutar(
+    puerto: int | None = None,
+    directorio_salida: str = ".",
+    lectores: int = 2,
+    codificadores: int | None = None,
+    alfabeto: str = "caracter",
+    n: int = 2,
+    estrategia: str = "fano",
+) -> None:
+    """Inicia el servidor sobre un socket local si se indica `puerto`, o sobre stdin."""
+    servidor = Servidor(directorio_salida, lectores, codificadores, alfabeto, n, estrategia)
+    try:
+        if puerto is None:
+            asyncio.run(servidor.atender_stdin())
+        else:
+            asyncio.run(servidor.atender_socket(puerto))
+    finally:
+        servidor.cerrar()
@@ -1,7 +1,11 @@
 import time
+from bisect import bisect_left
+from itertools import accumulate
 from typing import Any
 
-def codificar_shannon_fano(datos: dict[str, Any]) -> dict[str, Any]:
+import codificador
+
+def codificar_shannon_fano(datos: dict[str, Any], estrategia: str = "fano") -> dict[str, Any]:
     """
     Codifica los símbolos utilizando el algoritmo de Shannon-Fano.
 
@@ -9,6 +13,7 @@ def codificar_shannon_fano(datos: dict[str, Any]) -> dict[str, Any]:
         datos (dict): Diccionario con las claves:
             - 'ListaSimbolos': lista de símbolos con sus probabilidades.
             - 'EntropiaTotal': valor de entropía del texto.
+        estrategia (str): Regla de división de los grupos ('fano' o 'balanceada').
 
     Returns:
         dict: Diccionario con los códigos generados, métricas de longitud, bits totales,
@@ -17,7 +22,7 @@ def codificar_shannon_fano(datos: dict[str, Any]) -> dict[str, Any]:
     inicio = time.perf_counter()
 
     # Asignar códigos binarios a cada símbolo
-    datos['Codigos'] = asignar_codigos(datos['ListaSimbolos'])
+    datos['Codigos'] = asignar_codigos(datos['ListaSimbolos'], estrategia=estrategia)
 
     longitud_promedio = 0
     total_bits = 0
@@ -70,62 +75,144 @@ def decodificar_shannon_fano(datos: dict[str, Any], texto_codificado: str) -> st
     return "".join(resultado)
 
 
-def asignar_codigos(simbolos: list[dict[str, Any]], prefijo: str = "", diccionario_codigos: dict[str, str] | None = None) -> dict[str, str]:
+ESTRATEGIAS = ("fano", "balanceada")
+
+
+def asignar_codigos(
+    simbolos: list[dict[str, Any]],
+    prefijo: str = "",
+    diccionario_codigos: dict[str, str] | None = None,
+    estrategia: str = "fano",
+) -> dict[str, str]:
     """
-    Asigna códigos binarios a los símbolos según el algoritmo Shannon-Fano (recursivo).
+    Asigna códigos binarios a los símbolos según el algoritmo Shannon-Fano.
+
+    Las sumas de probabilidad se precalculan una vez (sumas prefijas sobre 'Cantidad')
+    y cada grupo se representa como un rango de índices, por lo que no se copian
+    sublistas ni se vuelve a sumar en cada nivel. El punto de corte se busca con
+    búsqueda binaria. Se recorre con una pila explícita para no depender del
+    límite de recursión en alfabetos grandes.
+
+    Args:
+        simbolos (list): Símbolos ordenados por frecuencia descendente.
+        prefijo (str): Prefijo común de todos los códigos.
+        diccionario_codigos (dict | None): Diccionario a completar.
+        estrategia (str): Regla de división, ver `dividir_rango`.
     """
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"shannon.py - Estrategia no soportada: {estrategia}")
     if diccionario_codigos is None:
         diccionario_codigos = {}
-
-    if len(simbolos) == 1:
-        codigo = prefijo or "0"
-        simbolo = simbolos[0]
-        simbolo["Code"] = codigo
-        diccionario_codigos[simbolo["Simbolo"]] = codigo
+    if not simbolos:
         return diccionario_codigos
 
-    izquierdo, derecho = dividir_simbolos(simbolos)
-    asignar_codigos(izquierdo, prefijo + "0", diccionario_codigos)
-    asignar_codigos(derecho, prefijo + "1", diccionario_codigos)
+    acumulados = sumas_prefijas(simbolos)
+    pendientes = [(0, len(simbolos), prefijo)]
+
+    while pendientes:
+        inicio, fin, codigo = pendientes.pop()
+        if fin - inicio == 1:
+            codigo = codigo or "0"
+            simbolo = simbolos[inicio]
+            simbolo["Code"] = codigo
+            diccionario_codigos[simbolo["Simbolo"]] = codigo
+            continue
+
+        corte = dividir_rango(acumulados, inicio, fin, estrategia)
+        pendientes.append((corte, fin, codigo + "1"))
+        pendientes.append((inicio, corte, codigo + "0"))
+
     return diccionario_codigos
 
 
-def dividir_simbolos(simbolos: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+def sumas_prefijas(simbolos: list[dict[str, Any]]) -> list[int]:
     """
-    Divide la lista de símbolos en dos grupos con probabilidades totales lo más equilibradas posible.
+    Devuelve las sumas prefijas de 'Cantidad': acumulados[i] es la suma de los i primeros símbolos.
+    Se usan las cantidades (enteras) en lugar de las probabilidades para que las comparaciones sean exactas.
+    """
+    return [0, *accumulate(s["Cantidad"] for s in simbolos)]
+
+
+def dividir_rango(acumulados: list[int], inicio: int, fin: int, estrategia: str = "fano") -> int:
     """
-    mitad = sum(s["Probabilidad"] for s in simbolos) / 2
-    acumulado = 0
-    indice_mejor = 0
-    min_diff = float("inf")
+    Calcula el punto de corte del rango [inicio, fin): el primer grupo es [inicio, corte)
+    y el segundo [corte, fin).
+
+    Estrategias:
+        - 'fano': regla original de Fano, el corte que deja las probabilidades de ambos
+          grupos lo más equilibradas posible (ante empate, el primero).
+        - 'balanceada': entre los dos cortes que rodean la mitad de la probabilidad,
+          el que deja una cantidad de símbolos más pareja en ambos grupos. Genera
+          árboles menos profundos con una diferencia de probabilidad casi igual.
+    """
+    # Con menos de dos símbolos no hay corte posible: todo queda en el primer grupo
+    if fin - inicio < 2:
+        return fin
+
+    # Comparar 2 * acumulado contra el total evita trabajar con la mitad fraccionaria
+    base = acumulados[inicio]
+    total = acumulados[fin] - base
+    objetivo = 2 * base + total
+
+    # Primer corte (entre inicio + 1 y fin - 1) cuyo acumulado alcanza la mitad
+    derecho = bisect_left(acumulados, objetivo, inicio + 1, fin - 1, key=lambda a: 2 * a)
+    izquierdo = max(derecho - 1, inicio + 1)
+
+    if estrategia == "balanceada":
+        centro = inicio + fin
+        return min(izquierdo, derecho, key=lambda c: abs(2 * c - centro))
 
-    for i in range(len(simbolos) - 1):
-        acumulado += simbolos[i]["Probabilidad"]
-        diff = abs(mitad - acumulado)
-        if diff < min_diff:
-            min_diff = diff
-            indice_mejor = i
+    diferencia_izquierda = abs(objetivo - 2 * acumulados[izquierdo])
+    diferencia_derecha = abs(objetivo - 2 * acumulados[derecho])
+    return derecho if diferencia_derecha < diferencia_izquierda else izquierdo
 
-    return simbolos[:indice_mejor + 1], simbolos[indice_mejor + 1:]
+
+def dividir_simbolos(simbolos: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Divide la lista de símbolos en dos grupos con probabilidades totales lo más equilibradas posible.
+    """
+    corte = dividir_rango(sumas_prefijas(simbolos), 0, len(simbolos))
+    return simbolos[:corte], simbolos[corte:]
 
 
-def generar_texto_codificado(datos: dict[str, Any], texto: str) -> str:
+def generar_texto_codificado(datos: dict[str, Any], texto: str | list[str]) -> str:
     """
     Genera el texto binario codificado a partir de un texto original y los códigos Shannon-Fano.
 
     Args:
         datos (dict): Diccionario con la clave 'Codigos' (mapa símbolo ↔ código).
-        texto (str): Texto original a codificar.
+        texto (str | list[str]): Texto original o secuencia de símbolos (ver simbolos.tokenizar).
 
     Returns:
         str: Texto codificado en binario.
     """
     inicio = time.perf_counter()
 
-    codigos = datos["Codigos"]
-    texto_codificado = "".join(codigos[s] for s in texto)
+    texto_codificado = codificador.codificar_bits(datos["Codigos"], texto)
 
     fin = time.perf_counter()
     datos["TiempoGeneracion"] = round(fin - inicio, 6)
 
     return texto_codificado
+
+
+def generar_bytes_codificados(datos: dict[str, Any], texto: str | list[str]) -> tuple[bytes, int]:
+    """
+    Genera el texto codificado empaquetado en bytes (8 bits por byte)
+    utilizando los códigos Shannon-Fano previamente generados.
+
+    Args:
+        datos (dict): Debe incluir 'Codigos'.
+        texto (str | list[str]): Texto original o secuencia de símbolos (ver simbolos.tokenizar).
+
+    Returns:
+        tuple: (bytes empaquetados, cantidad de bits válidos).
+    """
+    inicio = time.perf_counter()
+
+    resultado = codificador.codificar_bytes(datos["Codigos"], texto)
+
+    fin = time.perf_counter()
+    datos["TiempoGeneracion"] = round(fin - inicio, 6)
+
+    return resultado
@@ -1,25 +1,191 @@
-from collections import Counter
 import math
+import re
 
-def calcular_informacion_simbolos(texto: str) -> dict:
+ALFABETOS = ("caracter", "ngrama", "palabra")
+
+# Palabras y secuencias de espacios como símbolos separados, para que la unión
+# de los símbolos reproduzca el texto original
+_PATRON_PALABRAS = re.compile(r"\S+|\s+")
+
+# Los pares se cuentan con un arreglo denso (np.bincount) solo si la cantidad de claves
+# posibles no supera este máximo ni _CLAVES_POR_PAR veces la cantidad de pares; si no,
+# ordenando (np.unique), para no reservar un arreglo enorme en textos cortos
+_MAXIMO_CONTEO_DENSO = 1 << 24
+_CLAVES_POR_PAR = 8
+
+# numpy se importa dentro de las funciones, igual que pandas en storage.py
+
+
+class SecuenciaSimbolos:
+    """
+    Texto dividido en símbolos de varios caracteres, representado como la tabla de
+    símbolos distintos (en orden de primera aparición) y un arreglo numpy con el
+    índice de cada posición. Se comporta como una secuencia de strings, por lo que
+    "".join(secuencia) reproduce el texto.
+    """
+    def __init__(self, alfabeto: list[str], indices):
+        self.alfabeto = alfabeto
+        self.indices = indices
+
+    @classmethod
+    def desde_lista(cls, simbolos: list[str]) -> "SecuenciaSimbolos":
+        """Crea la secuencia a partir de una lista de símbolos (por ejemplo, palabras)."""
+        import numpy as np
+
+        ids: dict[str, int] = {}
+        indices = np.fromiter(
+            (ids.setdefault(s, len(ids)) for s in simbolos), dtype=np.intp, count=len(simbolos)
+        )
+        return cls(list(ids), indices)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, posicion: int) -> str:
+        return self.alfabeto[self.indices[posicion]]
+
+    def __iter__(self):
+        alfabeto = self.alfabeto
+        return (alfabeto[i] for i in self.indices.tolist())
+
+
+def _indexar_caracteres(texto: str):
     """
-    Calcula las métricas de información de los símbolos de un texto:
+    Devuelve (caracteres distintos en orden de primera aparición, índice de cada posición),
+    trabajando sobre el arreglo de puntos de código del texto.
+    """
+    import numpy as np
+
+    puntos = np.frombuffer(texto.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+    primera = np.full(int(puntos.max()) + 1, len(puntos), dtype=np.intp)
+    np.minimum.at(primera, puntos, np.arange(len(puntos)))
+
+    presentes = np.flatnonzero(primera < len(puntos))
+    presentes = presentes[np.argsort(primera[presentes], kind="stable")]
+    lut = np.zeros(len(primera), dtype=np.intp)
+    lut[presentes] = np.arange(len(presentes))
+    return [chr(p) for p in presentes.tolist()], lut[puntos]
+
+
+def _indexar_ngramas(texto: str, n: int) -> SecuenciaSimbolos:
+    """
+    Divide el texto en n-gramas sin solapamiento contando sobre arreglos: cada n-grama
+    completo se empaqueta en un entero (base = cantidad de caracteres distintos) y los
+    enteros distintos se identifican con np.unique. El último bloque, si es más corto,
+    es un símbolo propio.
+    """
+    import numpy as np
+
+    caracteres, ids_caracteres = _indexar_caracteres(texto)
+    completos = len(texto) // n
+    filas = ids_caracteres[:completos * n].reshape(completos, n)
+
+    base = len(caracteres)
+    if base ** n < 1 << 62:
+        claves = filas @ (base ** np.arange(n - 1, -1, -1, dtype=np.int64))
+        _, primera, indices = np.unique(claves, return_index=True, return_inverse=True)
+    else:
+        _, primera, indices = np.unique(filas, axis=0, return_index=True, return_inverse=True)
+    indices = indices.reshape(-1)
+
+    # Reordenar los índices por primera aparición
+    orden = np.argsort(primera, kind="stable")
+    rango = np.empty(len(orden), dtype=np.intp)
+    rango[orden] = np.arange(len(orden))
+    indices = rango[indices]
+    alfabeto = [texto[i * n:(i + 1) * n] for i in primera[orden].tolist()]
+
+    if completos * n < len(texto):
+        alfabeto.append(texto[completos * n:])
+        indices = np.append(indices, len(alfabeto) - 1)
+    return SecuenciaSimbolos(alfabeto, indices)
+
+
+def tokenizar(texto: str, alfabeto: str = "caracter", n: int = 2) -> str | SecuenciaSimbolos:
+    """
+    Divide el texto en los símbolos del alfabeto elegido:
+    - 'caracter': cada carácter (devuelve el propio texto)
+    - 'ngrama': bloques consecutivos de n caracteres sin solapamiento (el último puede ser más corto)
+    - 'palabra': palabras delimitadas por espacios y las secuencias de espacios entre ellas
+    En todos los casos "".join(símbolos) == texto, por lo que la decodificación no cambia.
+    """
+    if alfabeto == "caracter":
+        return texto
+    if alfabeto == "ngrama":
+        if n < 1:
+            raise ValueError(f"symbols.py - Tamaño de n-grama inválido: {n}")
+        if not texto:
+            return SecuenciaSimbolos.desde_lista([])
+        return _indexar_ngramas(texto, n)
+    if alfabeto == "palabra":
+        return SecuenciaSimbolos.desde_lista(_PATRON_PALABRAS.findall(texto))
+    raise ValueError(f"symbols.py - Alfabeto no soportado: {alfabeto}")
+
+
+def calcular_entropia_condicional(indices, cantidad_simbolos: int) -> float:
+    """
+    Calcula H(X|anterior): la entropía de cada símbolo dado el símbolo que lo precede.
+
+    Los pares consecutivos se cuentan con numpy como claves anterior * k + actual,
+    con un arreglo denso si k² es chico frente al máximo y a la cantidad de pares,
+    u ordenando si no.
+    """
+    import numpy as np
+
+    if len(indices) < 2:
+        return 0.0
+
+    k = cantidad_simbolos
+    total_pares = len(indices) - 1
+    claves = indices[:-1].astype(np.int64) * k + indices[1:]
+    if k * k <= min(_MAXIMO_CONTEO_DENSO, _CLAVES_POR_PAR * total_pares):
+        conteo = np.bincount(claves, minlength=k * k)
+        pares = np.flatnonzero(conteo)
+        cantidad_pares = conteo[pares]
+    else:
+        pares, cantidad_pares = np.unique(claves, return_counts=True)
+    # Veces que cada símbolo aparece como anterior (todas menos la última posición)
+    cantidad_anterior = np.bincount(indices[:-1], minlength=k)
+
+    probabilidad_condicional = cantidad_pares / cantidad_anterior[pares // k]
+    return float(-(cantidad_pares / total_pares * np.log2(probabilidad_condicional)).sum())
+
+
+def calcular_informacion_simbolos(texto: str | list[str] | SecuenciaSimbolos) -> dict:
+    """
+    Calcula las métricas de información de los símbolos de un texto
+    (o de una secuencia de símbolos generada con `tokenizar`):
     - Cantidad de cada símbolo
     - Probabilidad
     - Información mutua
     - Entropía
+    - Entropía condicional al símbolo anterior, H(X|anterior)
+    - Ambas entropías por carácter del texto, para comparar alfabetos
     Retorna un diccionario con estadísticas generales y la lista de símbolos.
     """
-    if not texto:
+    import numpy as np
+
+    if not len(texto):
         return {
             "TotalSimbolos": 0,
             "ProbabilidadTotal": 0,
             "EntropiaTotal": 0,
+            "EntropiaCondicional": 0,
+            "EntropiaPorCaracter": 0,
+            "EntropiaCondicionalPorCaracter": 0,
             "ListaSimbolos": []
         }
 
-    total_simbolos = len(texto)
-    conteos = Counter(texto)
+    # Símbolos distintos en orden de primera aparición y el índice de cada posición
+    if isinstance(texto, str):
+        alfabeto, indices = _indexar_caracteres(texto)
+    else:
+        if not isinstance(texto, SecuenciaSimbolos):
+            texto = SecuenciaSimbolos.desde_lista(texto)
+        alfabeto, indices = texto.alfabeto, texto.indices
+
+    total_simbolos = len(indices)
+    conteos = dict(zip(alfabeto, np.bincount(indices, minlength=len(alfabeto)).tolist()))
     lista_simbolos = []
 
     for simbolo, cantidad in conteos.items():
@@ -44,10 +210,18 @@ def calcular_informacion_simbolos(texto: str) -> dict:
         raise ValueError(f"symbols.py - Probabilidad total distinta de 1: {probabilidad_total}")
 
     entropia_total = sum(s["Entropia"] for s in lista_simbolos)
+    entropia_condicional = calcular_entropia_condicional(indices, len(alfabeto))
+
+    # Caracteres por símbolo (1 en el alfabeto de caracteres)
+    total_caracteres = sum(len(s) * c for s, c in conteos.items())
+    simbolos_por_caracter = total_simbolos / total_caracteres
 
     return {
         "TotalSimbolos": total_simbolos,
         "ProbabilidadTotal": probabilidad_total,
         "EntropiaTotal": entropia_total,
+        "EntropiaCondicional": entropia_condicional,
+        "EntropiaPorCaracter": entropia_total * simbolos_por_caracter,
+        "EntropiaCondicionalPorCaracter": entropia_condicional * simbolos_por_caracter,
         "ListaSimbolos": lista_simbolos
     }
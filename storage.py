@@ -1,4 +1,5 @@
-import pandas as pd
+# pandas (y openpyxl a través de él) se importa al guardar o cargar una planilla,
+# para no pagar su tiempo de carga al importar el módulo.
 
 # ========================
 # Funciones genéricas de Excel
@@ -16,6 +17,7 @@ def _limpiar_lista_records(lista):
 
 def _guardar_excel(ruta, hojas: dict):
     """Guarda un diccionario de listas/records en un archivo Excel limpiando caracteres."""
+    import pandas as pd
     with pd.ExcelWriter(ruta, engine="openpyxl") as writer:
         for nombre, contenido in hojas.items():
             # Limpiar si es lista de diccionarios
@@ -25,6 +27,7 @@ def _guardar_excel(ruta, hojas: dict):
 
 def _cargar_excel(ruta, hojas: list):
     """Carga varias hojas de un Excel y devuelve un diccionario de DataFrames."""
+    import pandas as pd
     return {h: pd.read_excel(ruta, sheet_name=h) for h in hojas}
 
 # ========================
@@ -34,7 +37,9 @@ def _cargar_excel(ruta, hojas: list):
 def persistir_simbolos(dic, ruta_excel):
     hojas = {
         "Simbolos": dic["ListaSimbolos"],
-        "Totales": [{k: dic[k] for k in ["TotalSimbolos","ProbabilidadTotal","EntropiaTotal"]}]
+        "Totales": [{k: dic.get(k,0) for k in ["TotalSimbolos","ProbabilidadTotal","EntropiaTotal",
+                                              "EntropiaCondicional","EntropiaPorCaracter",
+                                              "EntropiaCondicionalPorCaracter"]}]
     }
     _guardar_excel(ruta_excel, hojas)
 
@@ -48,7 +53,7 @@ def recuperar_simbolos(ruta_excel):
 def persistir_shannon_fano(dic, ruta_excel):
     hojas = {
         "Simbolos": dic["ListaSimbolos"],
-        "Totales": [{k: dic.get(k,0) for k in ["TotalSimbolos","ProbabilidadTotal","EntropiaTotal",
+        "Totales": [{k: dic.get(k,0) for k in ["TotalSimbolos","ProbabilidadTotal","EntropiaTotal","EntropiaCondicional",
                                               "LongitudPromedio","TotalBits","Eficiencia",
                                               "TiempoCodificacion","TiempoDecodificacion"]}]
     }
@@ -73,7 +78,7 @@ def recuperar_shannon_fano(ruta_excel):
 def persistir_huffman(dic, ruta_excel):
     hojas = {
         "Simbolos": dic["ListaSimbolos"],
-        "Totales": [{k: dic.get(k,0) for k in ["TotalSimbolos","ProbabilidadTotal","EntropiaTotal",
+        "Totales": [{k: dic.get(k,0) for k in ["TotalSimbolos","ProbabilidadTotal","EntropiaTotal","EntropiaCondicional",
                                               "LongitudPromedio","TotalBits","Eficiencia",
                                               "TiempoCodificacion","TiempoDecodificacion"]}]
     }